@@ -1,15 +1,18 @@
 # main.py
 import sys
 import signal
-import random
 import math
+import numpy as np
 from enum import Enum, auto
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QGridLayout, QGroupBox, QSizePolicy
 )
-from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QLinearGradient, QGradient, QPainterPath
-from PySide6.QtCore import Qt, QRectF, QTimer, Slot, QPointF
+from PySide6.QtGui import (
+    QPainter, QColor, QBrush, QPen, QFont, QLinearGradient, QGradient, QPolygonF,
+    QPixmap, QPixmapCache, QImage
+)
+from PySide6.QtCore import Qt, QRectF, QTimer, Slot, Signal, QPointF, QEvent, QObject, QThread
 
 # --- 위젯 스타일시트 ---
 STYLESHEET = """
@@ -74,6 +77,74 @@ class Constants:
     COLOR_SAFE = QColor("#1E88E5")      # Blue
     COLOR_BACKGROUND = QColor("#444")
     COLOR_GRID_LINE = QColor("#2E2E2E")
+    COLOR_WINDOW_BACKGROUND = QColor("#2E2E2E") # 스타일시트의 QWidget 배경색
+
+    # 센서 데이터 갱신 주기 (ms)
+    SENSOR_INTERVAL_MS = 200
+    SENSOR_INTERVAL_IDLE_MS = 500   # 'OK' 상태가 안정적으로 유지될 때
+    SENSOR_INTERVAL_ALERT_MS = 100  # 장애물/기울기 경고 상태일 때
+    # 'OK' 상태에서 최소 감지 거리 변화가 허용치 이내로 연속 유지되어야 하는 주기 수
+    SENSOR_STABLE_TICKS = 10
+    SENSOR_STABLE_TOLERANCE_MM = 100
+
+    # QPixmapCache 용량 (KB)
+    PIXMAP_CACHE_LIMIT_KB = 4096
+
+def _threshold_color(distance_mm: int) -> QColor:
+    """임계값 비교로 거리에 해당하는 색상을 결정 (LUT 생성용)"""
+    if distance_mm < Constants.OBSTACLE_DIST_CRITICAL: return Constants.COLOR_CRITICAL
+    if distance_mm < Constants.OBSTACLE_DIST_WARNING: return Constants.COLOR_WARNING
+    if distance_mm < Constants.OBSTACLE_DIST_CAUTION: return Constants.COLOR_CAUTION
+    if distance_mm < Constants.OBSTACLE_DIST_NORMAL: return Constants.COLOR_NORMAL
+    return Constants.COLOR_SAFE
+
+# 거리 -> 색상 룩업 테이블 (100mm 단위, 0 ~ 4000mm)
+# 모든 임계값이 100mm 의 배수이므로 구간 경계가 정확히 일치함
+_COLOR_LUT = [_threshold_color(d * 100) for d in range(41)]
+# 같은 테이블의 0xAARRGGBB 값 (QImage 픽셀 직접 기록용)
+_COLOR_RGB = [color.rgb() for color in _COLOR_LUT]
+# NumPy 벡터 연산용 배열 버전
+_COLOR_RGB_ARRAY = np.array(_COLOR_RGB, dtype=np.uint32)
+
+def color_for_distance(distance_mm) -> QColor:
+    """거리에 따라 색상을 반환 (가까울수록 빨간색)"""
+    return _COLOR_LUT[max(0, min(int(distance_mm), 4000)) // 100]
+
+def widget_pixmap(widget: QWidget) -> QPixmap:
+    """위젯의 장치 픽셀 비율(HiDPI)을 반영한, 위젯 크기의 빈 픽스맵을 생성"""
+    dpr = widget.devicePixelRatioF()
+    pixmap = QPixmap(widget.size() * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+def is_stale_pixmap(pixmap: QPixmap, widget: QWidget) -> bool:
+    """미리 그려둔 픽스맵이 없거나 위젯의 장치 픽셀 비율이 바뀌었는지 확인"""
+    return pixmap is None or pixmap.devicePixelRatio() != widget.devicePixelRatioF()
+
+def render_pixmap(widget: QWidget, render) -> QPixmap:
+    """
+    위젯 크기의 픽스맵을 배경색으로 채운 뒤 render(painter) 로 내용을 그려 반환합니다.
+    :param widget: 픽스맵 크기와 폰트를 가져올 위젯
+    :param render: QPainter 를 받아 위젯 내용을 그리는 함수
+    """
+    pixmap = widget_pixmap(widget)
+    pixmap.fill(Constants.COLOR_WINDOW_BACKGROUND)
+    painter = QPainter(pixmap)
+    painter.setFont(widget.font())
+    render(painter)
+    painter.end()
+    return pixmap
+
+def cached_pixmap(key: str, widget: QWidget, render) -> QPixmap:
+    """
+    QPixmapCache 에서 key 에 해당하는 픽스맵을 찾고, 없으면 새로 그려서 등록합니다.
+    :param key: 화면에 표시되는 상태를 식별하는 캐시 키 (위젯 크기와 장치 픽셀 비율 포함)
+    """
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = render_pixmap(widget, render)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 class DisplayMode(Enum):
     """장애물 표시 모드 열거형"""
@@ -85,69 +156,129 @@ class DisplayMode(Enum):
 # -----------------------------------------------------------------------------
 class TiltIndicatorWidget(QWidget):
     """두 TFmini 센서의 데이터를 바탕으로 기울기를 시각화하는 위젯"""
+    BUBBLE_RADIUS = 18
+
+    # 매 프레임 재사용하는 펜/브러시
+    _TICK_PEN = QPen(Qt.white, 1, Qt.DotLine)
+    _TEXT_PEN = QPen(Qt.white)
+    _NO_PEN = QPen(Qt.NoPen)
+    _BRUSH_NORMAL = QBrush(Constants.COLOR_NORMAL)
+    _BRUSH_CAUTION = QBrush(Constants.COLOR_CAUTION)
+    _BRUSH_CRITICAL = QBrush(Constants.COLOR_CRITICAL)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._angle = 0.0
+        self._bubble_px = None # 마지막으로 그린 버블의 픽셀 오프셋
+        self._bg_pixmap = None # 배경과 눈금을 미리 그려둔 픽스맵
+        self._bold_font = None # 각도 표시용 굵은 폰트 (위젯 폰트 기준)
         self.setMinimumSize(300, 60)
+        # paintEvent 가 위젯 전체를 직접 채우므로 Qt 의 배경 지우기를 생략
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
     @Slot(float)
     def setAngle(self, angle: float):
-        """기울기 각도를 업데이트하고 위젯을 다시 그립니다."""
-        if self._angle != angle:
+        """
+        기울기 각도를 업데이트하고, 화면에 보이는 변화가 있을 때만 버블 영역을 다시 그립니다.
+        버블 위치(픽셀), 색상, 각도 레이블 문자열이 모두 같으면 다시 그리지 않음
+        """
+        offset_px = int(self._bubble_offset(angle))
+        if (offset_px == self._bubble_px
+                and f"{angle:.1f}" == f"{self._angle:.1f}"
+                and self._bubble_brush(angle) is self._bubble_brush(self._angle)):
             self._angle = angle
-            self.update()
+            return
+
+        old_rect = self._bubble_rect(self._angle)
+        self._angle = angle
+        self._bubble_px = offset_px
+        # 이전/현재 버블 영역만 갱신 (안티앨리어싱 가장자리를 위해 1px 여유)
+        self.update(old_rect.united(self._bubble_rect(angle)).toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def _bubble_brush(self, angle: float) -> QBrush:
+        """기울기 상태에 따른 버블 브러시 결정"""
+        if abs(angle) < Constants.TILT_ANGLE_NORMAL:
+            return self._BRUSH_NORMAL
+        if abs(angle) < Constants.TILT_ANGLE_WARNING:
+            return self._BRUSH_CAUTION
+        return self._BRUSH_CRITICAL
+
+    def _bubble_offset(self, angle: float) -> float:
+        """각도에 따른 버블의 중심 x 오프셋 (최대 각도를 45도로 가정)"""
+        max_offset = (self.width() / 2) - self.BUBBLE_RADIUS - 5
+        return (angle / 45.0) * max_offset
+
+    def _bubble_rect(self, angle: float) -> QRectF:
+        center = self.rect().center()
+        # setAngle 의 생략 판정과 같은 정수 픽셀 오프셋에 그려서, 생략된 갱신이 화면과 어긋나지 않도록 함
+        bubble_x = center.x() + int(self._bubble_offset(angle))
+        radius = self.BUBBLE_RADIUS
+        return QRectF(bubble_x - radius, center.y() - radius, radius * 2, radius * 2)
+
+    def resizeEvent(self, event):
+        # 배경 픽스맵과 버블 위치는 위젯 폭에 따라 달라지므로 다시 계산
+        self._bg_pixmap = None
+        self._bubble_px = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._bold_font = None
+        super().changeEvent(event)
 
     def paintEvent(self, event):
+        if is_stale_pixmap(self._bg_pixmap, self):
+            self._bg_pixmap = render_pixmap(self, self._render_background)
+
+        # 배경을 복사한 뒤 버블을 그림 (QPainter 가 갱신 영역으로 클리핑하므로 그 부분만 복사됨)
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # 기울기 상태에 따른 색상과 위치로 버블 그리기
+        painter.setBrush(self._bubble_brush(self._angle))
+        painter.setPen(self._NO_PEN)
+        bubble_rect = self._bubble_rect(self._angle)
+        painter.drawEllipse(bubble_rect)
+
+        if self._bold_font is None:
+            self._bold_font = QFont(self.font())
+            self._bold_font.setBold(True)
+        painter.setPen(self._TEXT_PEN)
+        painter.setFont(self._bold_font)
+        painter.drawText(bubble_rect, Qt.AlignCenter, f"{self._angle:.1f}°")
+
+    def _render_background(self, painter: QPainter):
+        """배경과 눈금처럼 각도와 무관한 부분을 그림"""
         painter.setRenderHint(QPainter.Antialiasing)
         rect = self.rect()
         painter.fillRect(rect, Constants.COLOR_BACKGROUND)
 
         # 눈금 그리기
-        painter.setPen(QPen(Qt.white, 1, Qt.DotLine))
+        painter.setPen(self._TICK_PEN)
         center_x = rect.center().x()
         tick_positions = [-0.5, -0.25, 0, 0.25, 0.5] # -50% ~ +50% 위치
         for pos in tick_positions:
             x = center_x + pos * (rect.width() * 0.8)
             painter.drawLine(int(x), rect.height() * 0.2, int(x), rect.height() * 0.8)
 
-        # 기울기 상태에 따른 버블 색상 결정
-        if abs(self._angle) < Constants.TILT_ANGLE_NORMAL:
-            bubble_color = Constants.COLOR_NORMAL
-        elif abs(self._angle) < Constants.TILT_ANGLE_WARNING:
-            bubble_color = Constants.COLOR_CAUTION
-        else:
-            bubble_color = Constants.COLOR_CRITICAL
-
-        painter.setBrush(QBrush(bubble_color))
-        painter.setPen(Qt.NoPen)
-
-        # 각도에 따라 버블 위치 계산
-        # 최대 각도를 45도로 가정
-        bubble_radius = 18
-        center_y = rect.center().y()
-        max_offset = (rect.width() / 2) - bubble_radius - 5
-        offset = (self._angle / 45.0) * max_offset
-        bubble_x = rect.center().x() + offset
-        
-        bubble_rect = QRectF(bubble_x - bubble_radius, center_y - bubble_radius, bubble_radius * 2, bubble_radius * 2)
-        painter.drawEllipse(bubble_rect)
-
-        painter.setPen(QPen(Qt.white))
-        font = painter.font()
-        font.setBold(True)
-        painter.setFont(font)
-        painter.drawText(bubble_rect, Qt.AlignCenter, f"{self._angle:.1f}°")
-
 # -----------------------------------------------------------------------------
 # 2. 장애물 감지 위젯 (히트맵)
 # -----------------------------------------------------------------------------
 class HeatmapWidget(QWidget):
     """VL53L5CX의 8x8 데이터를 히트맵으로 시각화하는 위젯"""
+    _GRID_PEN = QPen(Constants.COLOR_GRID_LINE, 1) # Grid line
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.distances = [4000] * 64
+        self._grid_pixmap = None # 셀 경계선만 그려둔 투명 픽스맵
         self.setFixedSize(280, 280)
+        self._cell_rects = self._build_cell_rects()
+        # paintEvent 가 위젯 전체를 직접 채우므로 Qt 의 배경 지우기를 생략
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
     @Slot(list)
     def update_data(self, new_distances: list):
@@ -157,45 +288,86 @@ class HeatmapWidget(QWidget):
 
     def get_color_for_distance(self, distance_mm: int):
         """거리에 따라 색상을 반환 (가까울수록 빨간색)"""
-        if distance_mm < Constants.OBSTACLE_DIST_CRITICAL: return Constants.COLOR_CRITICAL
-        if distance_mm < Constants.OBSTACLE_DIST_WARNING: return Constants.COLOR_WARNING
-        if distance_mm < Constants.OBSTACLE_DIST_CAUTION: return Constants.COLOR_CAUTION
-        if distance_mm < Constants.OBSTACLE_DIST_NORMAL: return Constants.COLOR_NORMAL
-        return Constants.COLOR_SAFE
+        return color_for_distance(distance_mm)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
+        # 색상 구간(100mm)이 같으면 화면도 같으므로 구간 인덱스로 캐시 키 생성
+        key = f"heatmap:{self.width()}x{self.height()}@{self.devicePixelRatioF()}:" + \
+            bytes(max(0, min(int(d), 4000)) // 100 for d in self.distances).hex()
+        QPainter(self).drawPixmap(0, 0, cached_pixmap(key, self, self._render))
+
+    def _build_cell_rects(self) -> list:
+        """64개 셀의 사각형을 행 우선 순서로 계산"""
         cell_width = self.width() / 8.0
         cell_height = self.height() / 8.0
-
-        for i in range(64):
-            row, col = divmod(i, 8)
-            distance = self.distances[i]
-            color = self.get_color_for_distance(distance)
-            
-            painter.setBrush(color)
-            painter.setPen(QPen(Constants.COLOR_GRID_LINE, 1)) # Grid line
-            
-            rect = QRectF(col * cell_width, row * cell_height, cell_width, cell_height)
-            painter.drawRect(rect)
+        return [QRectF(col * cell_width, row * cell_height, cell_width, cell_height)
+                for row in range(8) for col in range(8)]
+
+    def resizeEvent(self, event):
+        # 셀 사각형과 경계선 픽스맵은 크기가 바뀔 때만 다시 계산
+        self._cell_rects = self._build_cell_rects()
+        self._grid_pixmap = None
+        super().resizeEvent(event)
+
+    def _grid(self) -> QPixmap:
+        """셀 경계선 오버레이 픽스맵을 반환"""
+        if is_stale_pixmap(self._grid_pixmap, self):
+            self._grid_pixmap = widget_pixmap(self)
+            self._grid_pixmap.fill(Qt.transparent)
+            painter = QPainter(self._grid_pixmap)
+            painter.setPen(self._GRID_PEN)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRects(self._cell_rects)
+            painter.end()
+        return self._grid_pixmap
+
+    def _render(self, painter: QPainter):
+        # 8x8 이미지에 셀 색상을 픽셀 단위로 기록한 뒤 위젯 크기로 확대해서 그림
+        image = QImage(8, 8, QImage.Format_RGB32)
+        pixels = image.bits().cast("I") # 한 줄이 32바이트라 패딩 없이 64개 연속
+        for i, distance in enumerate(self.distances):
+            pixels[i] = _COLOR_RGB[max(0, min(int(distance), 4000)) // 100]
+        painter.drawImage(self.rect(), image)
+        painter.drawPixmap(0, 0, self._grid())
 
 # -----------------------------------------------------------------------------
 # 2.1. 새로운 장애물 감지 위젯 (정면 뷰 - 수직 막대)
 # -----------------------------------------------------------------------------
 class ObstacleColumnWidget(QWidget):
     """하나의 S2 센서에서 받은 8개 거리 데이터를 수직 막대로 시각화"""
+    _TEXT_PEN = QPen(Qt.white)
+    _LINE_PEN = QPen(Constants.COLOR_CAUTION, 2)
+
     def __init__(self, sensor_name: str, parent=None):
         super().__init__(parent)
         self.sensor_name = sensor_name
         self.distances = [4000] * 8  # 8개 픽셀 데이터
         self.display_mode = DisplayMode.BAR # 기본 표시 모드
+        self._last_displayed_bins = None # 마지막으로 요청한 화면의 색상 구간 + 막대 높이
         self.setMinimumSize(60, 200)
+        # paintEvent 가 위젯 전체를 직접 채우므로 Qt 의 배경 지우기를 생략
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
-    @Slot(list)
-    def update_data(self, new_distances: list):
+    @Slot(object)
+    def update_data(self, new_distances):
+        """8개 거리 데이터(list 또는 ndarray)를 저장하고, 화면에 보이는 변화가 있을 때만 다시 그립니다."""
         if len(new_distances) == 8:
             self.distances = new_distances
-            self.update()
+            displayed_bins = self._displayed_bins(new_distances)
+            if not np.array_equal(displayed_bins, self._last_displayed_bins):
+                self._last_displayed_bins = displayed_bins
+                self.update()
+
+    def _displayed_bins(self, distances) -> np.ndarray:
+        """
+        거리 데이터를 화면에 보이는 단위(색상 구간, 장치 픽셀 단위 막대 높이)로 양자화합니다.
+        막대 높이는 _render_bars 와 같은 규칙(_bar_rows)으로 계산하므로, 결과가 같으면 그려지는 막대도 같음
+        """
+        dist = np.clip(np.asarray(distances, dtype=np.int32), 0, 4000)
+        bar_area_height = self.height() - 20  # 상단 텍스트 영역 제외
+        rows = round(bar_area_height * self.devicePixelRatioF())
+        return np.concatenate((dist // 100, self._bar_rows(dist, rows)))
 
     @Slot(DisplayMode)
     def setDisplayMode(self, mode: DisplayMode):
@@ -204,18 +376,20 @@ class ObstacleColumnWidget(QWidget):
             self.update()
 
     def get_color_for_distance(self, distance_mm: int):
-        if distance_mm < Constants.OBSTACLE_DIST_CRITICAL: return Constants.COLOR_CRITICAL
-        if distance_mm < Constants.OBSTACLE_DIST_WARNING: return Constants.COLOR_WARNING
-        if distance_mm < Constants.OBSTACLE_DIST_CAUTION: return Constants.COLOR_CAUTION
-        if distance_mm < Constants.OBSTACLE_DIST_NORMAL: return Constants.COLOR_NORMAL
-        return Constants.COLOR_SAFE
+        return color_for_distance(distance_mm)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
+        # 화면에 보이는 값(색상 구간 + 장치 픽셀 단위 막대 높이)이 같으면 캐시된 픽스맵을 재사용
+        key = (f"col:{self.sensor_name}:{self.display_mode.name}:"
+               f"{self.width()}x{self.height()}@{self.devicePixelRatioF()}:") + \
+            self._displayed_bins(self.distances).tobytes().hex()
+        QPainter(self).drawPixmap(0, 0, cached_pixmap(key, self, self._render))
+
+    def _render(self, painter: QPainter):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # 센서 이름 표시
-        painter.setPen(Qt.white)
+        painter.setPen(self._TEXT_PEN)
         painter.drawText(self.rect(), Qt.AlignHCenter | Qt.AlignTop, self.sensor_name)
 
         # 8개의 막대 그리기
@@ -224,34 +398,57 @@ class ObstacleColumnWidget(QWidget):
         max_dist = 4000.0  # 최대 거리 4m
 
         if self.display_mode == DisplayMode.BAR:
-            for i, dist in enumerate(self.distances):
-                color = self.get_color_for_distance(dist)
-                painter.setBrush(color)
-                painter.setPen(Qt.NoPen)
-
-                # 거리에 따라 막대 높이 계산 (거리가 짧을수록 막대가 길어짐)
-                bar_height_ratio = 1.0 - (min(dist, max_dist) / max_dist)
-                bar_height = bar_area_height * bar_height_ratio
-                
-                rect = QRectF(i * bar_width, self.height() - bar_height, bar_width - 2, bar_height)
-                painter.drawRect(rect)
+            if bar_area_height > 0:
+                painter.drawImage(0, self.height() - bar_area_height,
+                                  self._render_bars(bar_area_height, bar_width, max_dist))
         
         elif self.display_mode == DisplayMode.LINE:
-            points = []
-            for i, dist in enumerate(self.distances):
-                bar_height_ratio = 1.0 - (min(dist, max_dist) / max_dist)
-                bar_height = bar_area_height * bar_height_ratio
-                x = (i + 0.5) * bar_width
-                y = self.height() - bar_height
-                points.append(QPointF(x, y))
-
-            path = QPainterPath()
-            path.moveTo(points[0])
-            for i in range(len(points) - 1):
-                path.lineTo(points[i+1])
-            
-            painter.setPen(QPen(Constants.COLOR_CAUTION, 2))
-            painter.drawPath(path)
+            # 막대 끝 위치를 꼭짓점으로 하는 꺾은선을 한 번에 그림
+            height = self.height()
+            points = [QPointF((i + 0.5) * bar_width,
+                              height - bar_area_height * (1.0 - (min(dist, max_dist) / max_dist)))
+                      for i, dist in enumerate(self.distances)]
+
+            painter.setPen(self._LINE_PEN)
+            painter.drawPolyline(QPolygonF(points))
+
+    @staticmethod
+    def _bar_rows(dist: np.ndarray, area_rows: int) -> np.ndarray:
+        """
+        막대 영역(area_rows 픽셀 행)에서 각 막대가 채우는 픽셀 행 수를 계산합니다.
+        픽셀 행의 중심이 막대 윗변보다 아래에 있으면 채우므로, 실수 높이를 반올림(0.5 올림)한 값과 같음
+        :param dist: 0 ~ 4000 으로 제한된 거리 배열 (mm)
+        """
+        # 거리에 따라 막대 높이 계산 (거리가 짧을수록 막대가 길어짐)
+        return np.floor(area_rows * (1.0 - dist / 4000.0) + 0.5).astype(np.int32)
+
+    def _render_bars(self, bar_area_height: int, bar_width: float, max_dist: float) -> QImage:
+        """
+        막대 영역을 위젯 폭 x bar_area_height 크기(장치 픽셀 기준)의 이미지로 래스터화합니다.
+        각 픽셀 열이 속한 막대의 높이와 색상을 NumPy 로 한 번에 채움 (막대 사이 2px 간격 유지)
+        """
+        dpr = self.devicePixelRatioF()
+        width_px = round(self.width() * dpr)
+        rows = round(bar_area_height * dpr)
+        dist = np.clip(np.asarray(self.distances, dtype=np.int32), 0, int(max_dist))
+        bar_rows = self._bar_rows(dist, rows)
+        bar_colors = _COLOR_RGB_ARRAY[dist // 100]
+
+        # 픽셀 열(중심, 논리 좌표 기준)마다 해당 막대 인덱스와 간격 여부 계산
+        x = (np.arange(width_px) + 0.5) / dpr
+        bar_index = np.minimum((x // bar_width).astype(np.intp), 7)
+        in_bar = (x - bar_index * bar_width) < (bar_width - 2)
+
+        # 아래쪽 bar_rows 개의 픽셀 행을 채움
+        y = np.arange(rows)[:, None]
+        filled = (y >= (rows - bar_rows)[bar_index]) & in_bar
+
+        image = QImage(width_px, rows, QImage.Format_RGB32)
+        image.setDevicePixelRatio(dpr)
+        pixels = np.frombuffer(image.bits(), dtype=np.uint32).reshape(
+            rows, image.bytesPerLine() // 4)[:, :width_px]
+        pixels[:] = np.where(filled, bar_colors[bar_index], np.uint32(Constants.COLOR_WINDOW_BACKGROUND.rgb()))
+        return image
 
 # -----------------------------------------------------------------------------
 # 2.1. 히트맵 범례 위젯
@@ -261,21 +458,31 @@ class ColorBarWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(40, 280)
+        self._cached = None # 그라데이션과 레이블을 미리 그려둔 픽스맵
+        # paintEvent 가 위젯 전체를 직접 채우므로 Qt 의 배경 지우기를 생략
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+
+    def resizeEvent(self, event):
+        self._cached = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
+        # 내용이 고정되어 있으므로 처음 그릴 때 한 번만 렌더링
+        if is_stale_pixmap(self._cached, self):
+            self._cached = render_pixmap(self, self._render)
+        QPainter(self).drawPixmap(0, 0, self._cached)
+
+    def _render(self, painter: QPainter):
         painter.setRenderHint(QPainter.Antialiasing)
         
         rect = self.rect()
         gradient = QLinearGradient(0, rect.height(), 0, 0)
         
-        # get_color_for_distance 로직과 일치하는 그라데이션 설정
-        gradient.setColorAt(0, Constants.COLOR_SAFE) # 2000mm+
-        gradient.setColorAt(1.0 - (Constants.OBSTACLE_DIST_NORMAL / 4000.0), Constants.COLOR_SAFE)
-        gradient.setColorAt(1.0 - (Constants.OBSTACLE_DIST_CAUTION / 4000.0), Constants.COLOR_NORMAL)
-        gradient.setColorAt(1.0 - (Constants.OBSTACLE_DIST_WARNING / 4000.0), Constants.COLOR_CAUTION)
-        gradient.setColorAt(1.0 - (Constants.OBSTACLE_DIST_CRITICAL / 4000.0), Constants.COLOR_WARNING)
-        gradient.setColorAt(1.0, Constants.COLOR_CRITICAL) # 0mm
+        # 히트맵과 동일한 색상 룩업 테이블로 그라데이션 설정 (4000mm+ ~ 0mm)
+        for dist in (4000, Constants.OBSTACLE_DIST_NORMAL, Constants.OBSTACLE_DIST_CAUTION,
+                     Constants.OBSTACLE_DIST_WARNING, Constants.OBSTACLE_DIST_CRITICAL, 0):
+            gradient.setColorAt(1.0 - (dist / 4000.0), color_for_distance(dist))
 
         painter.fillRect(QRectF(0, 0, 20, rect.height()), gradient)
 
@@ -290,7 +497,150 @@ class ColorBarWidget(QWidget):
             painter.drawText(22, int(rect.height() * pos) + 5, text)
 
 # -----------------------------------------------------------------------------
-# 3. 메인 대시보드 윈도우
+# 3. 센서 데이터 워커 (별도 스레드)
+# -----------------------------------------------------------------------------
+class SensorWorker(QObject):
+    """
+    센서 데이터(현재는 시뮬레이션)를 GUI 와 별도의 스레드에서 생성하여 시그널로 전달하는 워커.
+    실제 TFmini / VL53L5CX 입출력으로 교체되어 읽기가 블로킹되더라도 화면 갱신이 멈추지 않습니다.
+    """
+    tiltChanged = Signal(float)               # 기울기 각도 (도)
+    tiltDistancesChanged = Signal(int, int)   # S1-L, S1-R 거리 (mm)
+    distancesChanged = Signal(object)         # S2 센서 5개 x 8개 픽셀 거리 (mm, ndarray)
+    statusChanged = Signal(int, str)          # 최소 감지 거리 (mm), 상태 키 ("OK" / "TILT" / "OBSTACLE")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timer = None
+        self._stable_ticks = 0 # 'OK' 상태로 안정적으로 유지된 연속 주기 수
+        self._last_min_dist = None
+
+        # --- 데이터 시뮬레이션을 위한 상태 변수 ---
+        self._last_sim_angle = 0.0
+        # 5개의 센서, 각 8개 픽셀의 초기 거리 값
+        self._last_sim_distances = np.full((5, 8), 4000, dtype=np.int32)
+        # 8개 픽셀의 중앙(3.5)으로부터의 오프셋 (가우시안 계산용)
+        self._J = np.arange(8, dtype=np.float64) - 3.5
+        # 시뮬레이션 전용 난수 생성기 (전역 random 상태를 공유하지 않음)
+        self._rng = np.random.default_rng()
+
+    @Slot()
+    def start(self):
+        """워커 스레드가 시작되면 호출되어 데이터 갱신 타이머를 시작합니다."""
+        # 타이머는 워커 스레드에서 생성해야 timeout 도 워커 스레드에서 처리됨
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.simulate_data)
+        self.timer.start(Constants.SENSOR_INTERVAL_MS)
+
+    @Slot()
+    def stop(self):
+        """데이터 갱신 타이머를 정지합니다. (워커 스레드에서 호출)"""
+        if self.timer is not None:
+            self.timer.stop()
+
+    def _update_interval(self, status: str, min_dist: int):
+        """
+        시스템 상태에 따라 갱신 주기를 조정합니다.
+        경고 상태에서는 주기를 줄이고, 'OK' 상태가 일정 주기 이상 안정적이면 주기를 늘립니다.
+        """
+        if status != "OK":
+            self._stable_ticks = 0
+            interval = Constants.SENSOR_INTERVAL_ALERT_MS
+        else:
+            if (self._last_min_dist is not None
+                    and abs(min_dist - self._last_min_dist) <= Constants.SENSOR_STABLE_TOLERANCE_MM):
+                self._stable_ticks += 1
+            else:
+                self._stable_ticks = 0
+            if self._stable_ticks >= Constants.SENSOR_STABLE_TICKS:
+                interval = Constants.SENSOR_INTERVAL_IDLE_MS
+            else:
+                interval = Constants.SENSOR_INTERVAL_MS
+        self._last_min_dist = min_dist
+
+        if self.timer is not None and self.timer.interval() != interval:
+            self.timer.setInterval(interval)
+
+    def simulate_person_obstacle(self, sensor_index: int, distance_to_person: int, shoulder_width_pixels: float):
+        """
+        특정 센서 아래에 가우시안 분포를 이용한 사람 형태의 장애물을 시뮬레이션합니다.
+        :param sensor_index: 사람이 위치할 센서의 인덱스 (0-4)
+        :param distance_to_person: 사람까지의 최소 거리 (mm)
+        :param shoulder_width_pixels: 사람 어깨 너비에 해당하는 픽셀 수 (표준편차 역할)
+        """
+        # 가우시안 함수: exp(-((x-mu)^2) / (2*sigma^2)), 8개 픽셀을 한 번에 계산
+        g = np.exp(-(self._J ** 2) / (2 * shoulder_width_pixels ** 2))
+        dist = distance_to_person + (4000 - distance_to_person) * (1 - g)
+        self._last_sim_distances[sensor_index] = dist.astype(np.int32)
+
+    @Slot()
+    def simulate_data(self):
+        """센서 데이터를 시뮬레이션하고 결과를 시그널로 전달합니다."""
+        # 1. 기울기 데이터 시뮬레이션 (점진적 변화)
+        # 이전 각도에서 -2 ~ +2도 사이로 변화
+        angle_change = self._rng.uniform(-2.0, 2.0)
+        self._last_sim_angle += angle_change
+        # 각도가 너무 커지지 않도록 범위 제한
+        if not -30 < self._last_sim_angle < 30:
+            self._last_sim_angle -= angle_change * 2 # 방향 반전
+
+        sim_angle = self._last_sim_angle
+
+        base_dist = 2000 # 기준 높이 2m
+        sensor_gap = 500 # 두 센서 간 거리 50cm 가정
+        dist_diff = math.tan(math.radians(sim_angle)) * sensor_gap
+        s1_l_dist = int(base_dist - dist_diff / 2)
+        s1_r_dist = int(base_dist + dist_diff / 2)
+
+        self.tiltChanged.emit(sim_angle)
+        self.tiltDistancesChanged.emit(s1_l_dist, s1_r_dist)
+
+        # 2. 장애물 데이터 시뮬레이션 (점진적 변화)
+        distances = self._last_sim_distances
+        # 이전 값에서 -50 ~ +50mm 사이로 변화 (5 x 8 전체를 한 번에 계산)
+        distances += self._rng.integers(-50, 51, size=distances.shape, dtype=np.int32)
+        # 최소/최대 거리 제한
+        np.clip(distances, 50, 4000, out=distances)
+
+        # 이번 주기의 확률 이벤트 판정값 (센서별 돌발 장애물 5개 + 사람 장애물 1개)
+        rolls = self._rng.random(6)
+
+        # 센서마다 2% 확률로 임의의 픽셀 하나에 갑작스러운 장애물 등장/사라짐
+        spike_rows = np.flatnonzero(rolls[:5] < 0.02)
+        if spike_rows.size:
+            spike_cols = self._rng.integers(0, 8, size=spike_rows.size)
+            current = distances[spike_rows, spike_cols]
+            # 현재 값이 멀면 가깝게, 가까우면 멀게 변경
+            distances[spike_rows, spike_cols] = np.where(
+                current > 1000,
+                self._rng.integers(50, 300, size=spike_rows.size),
+                self._rng.integers(1500, 4001, size=spike_rows.size))
+
+        # 10% 확률로 '사람' 장애물 시뮬레이션 실행
+        if rolls[5] < 0.1:
+            target_sensor = int(self._rng.integers(0, 5)) # 5개 센서 중 하나를 랜덤 선택
+            person_dist = int(self._rng.integers(400, 1201)) # 사람까지의 거리
+            shoulder_width = self._rng.uniform(1.5, 2.5) # 사람 어깨 너비
+            self.simulate_person_obstacle(target_sensor, person_dist, shoulder_width)
+
+        # 5개 센서를 한 번에 전달 (GUI 스레드와 배열을 공유하지 않도록 복사본 전송)
+        self.distancesChanged.emit(self._last_sim_distances.copy())
+
+        min_dist = int(self._last_sim_distances.min())
+
+        # 3. 전체 시스템 상태 판정
+        if min_dist < Constants.OBSTACLE_DIST_CRITICAL:
+            status = "OBSTACLE"
+        elif abs(sim_angle) > Constants.TILT_ANGLE_WARNING:
+            status = "TILT"
+        else:
+            status = "OK"
+        self.statusChanged.emit(min_dist, status)
+        self._update_interval(status, min_dist)
+
+
+# -----------------------------------------------------------------------------
+# 4. 메인 대시보드 윈도우
 # -----------------------------------------------------------------------------
 class SraderDashboard(QMainWindow):
     def __init__(self):
@@ -350,10 +700,16 @@ class SraderDashboard(QMainWindow):
         self.status_label = QLabel("SYSTEM INITIALIZING...")
         self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
+        self._current_status = None # 현재 표시 중인 상태 키
         
         main_layout.addWidget(self.status_label)
 
-        # --- 상태별 스타일시트 미리 정의 ---
+        # --- 상태별 메시지와 스타일시트 미리 정의 ---
+        self.status_messages = {
+            "OK": "SYSTEM OK",
+            "TILT": "TILT WARNING",
+            "OBSTACLE": "!!! OBSTACLE DETECTED !!!"
+        }
         self.status_styles = {
             "OK": f"background-color: {Constants.COLOR_NORMAL.name()};",
             "TILT": f"background-color: {Constants.COLOR_WARNING.name()};",
@@ -364,15 +720,26 @@ class SraderDashboard(QMainWindow):
         self.bar_view_button.clicked.connect(self.set_bar_view)
         self.line_view_button.clicked.connect(self.set_line_view)
 
-        # --- 데이터 시뮬레이션을 위한 상태 변수 ---
-        self._last_sim_angle = 0.0
-        # 5개의 센서, 각 8개 픽셀의 초기 거리 값
-        self._last_sim_distances = [[4000] * 8 for _ in range(5)]
-
-        # --- 데이터 시뮬레이션 타이머 ---
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.simulate_data)
-        self.timer.start(200) # 0.2초마다 데이터 업데이트
+        # --- 센서 데이터 워커 스레드 ---
+        self.sensor_thread = QThread(self)
+        self.sensor_worker = SensorWorker()
+        self.sensor_worker.moveToThread(self.sensor_thread)
+        self.sensor_thread.started.connect(self.sensor_worker.start)
+        self.sensor_thread.finished.connect(self.sensor_worker.stop)
+        self.sensor_thread.finished.connect(self.sensor_worker.deleteLater)
+
+        # 워커 스레드의 시그널은 GUI 스레드의 이벤트 큐를 거쳐 전달
+        self.sensor_worker.tiltChanged.connect(self.tilt_indicator.setAngle, Qt.QueuedConnection)
+        self.sensor_worker.tiltDistancesChanged.connect(self.update_tilt_distances, Qt.QueuedConnection)
+        self.sensor_worker.distancesChanged.connect(self.update_obstacle_data, Qt.QueuedConnection)
+        self.sensor_worker.statusChanged.connect(self.update_status, Qt.QueuedConnection)
+        self.sensor_thread.start()
+
+    def closeEvent(self, event):
+        """창을 닫을 때 센서 워커 스레드를 정리합니다."""
+        self.sensor_thread.quit()
+        self.sensor_thread.wait()
+        super().closeEvent(event)
 
     @Slot()
     def set_bar_view(self):
@@ -386,94 +753,42 @@ class SraderDashboard(QMainWindow):
         for widget in self.obstacle_widgets:
             widget.setDisplayMode(DisplayMode.LINE)
 
-    def simulate_person_obstacle(self, sensor_index: int, distance_to_person: int, shoulder_width_pixels: float):
+    @Slot(int, int)
+    def update_tilt_distances(self, s1_l_dist: int, s1_r_dist: int):
+        """S1 센서 거리 레이블을 업데이트합니다. (표시 문자열이 바뀐 경우에만)"""
+        s1_l_text = f"S1-L: {s1_l_dist} mm"
+        if self.s1_l_label.text() != s1_l_text:
+            self.s1_l_label.setText(s1_l_text)
+        s1_r_text = f"S1-R: {s1_r_dist} mm"
+        if self.s1_r_label.text() != s1_r_text:
+            self.s1_r_label.setText(s1_r_text)
+
+    @Slot(object)
+    def update_obstacle_data(self, distances):
         """
-        특정 센서 아래에 가우시안 분포를 이용한 사람 형태의 장애물을 시뮬레이션합니다.
-        :param sensor_index: 사람이 위치할 센서의 인덱스 (0-4)
-        :param distance_to_person: 사람까지의 최소 거리 (mm)
-        :param shoulder_width_pixels: 사람 어깨 너비에 해당하는 픽셀 수 (표준편차 역할)
+        한 주기의 S2 센서 데이터를 장애물 위젯에 나누어 전달합니다.
+        각 위젯은 화면에 보이는 값이 바뀐 경우에만 다시 그립니다.
+        :param distances: 5 x 8 거리 배열 (mm)
         """
-        sensor_data = [4000] * 8
-        center_pixel = 3.5  # 8개 픽셀의 중앙
-
-        for j in range(8):
-            # 가우시안 함수: exp(-((x-mu)^2) / (2*sigma^2))
-            exponent = -((j - center_pixel) ** 2) / (2 * shoulder_width_pixels ** 2)
-            dist = distance_to_person + (4000 - distance_to_person) * (1 - math.exp(exponent))
-            self._last_sim_distances[sensor_index][j] = int(dist)
-
-    @Slot()
-    def simulate_data(self):
-        """센서 데이터를 시뮬레이션하고 GUI를 업데이트합니다."""
-        # 1. 기울기 데이터 시뮬레이션 (점진적 변화)
-        # 이전 각도에서 -2 ~ +2도 사이로 변화
-        angle_change = (random.random() - 0.5) * 4
-        self._last_sim_angle += angle_change
-        # 각도가 너무 커지지 않도록 범위 제한
-        if not -30 < self._last_sim_angle < 30:
-            self._last_sim_angle -= angle_change * 2 # 방향 반전
-
-        sim_angle = self._last_sim_angle
+        for widget, sensor_distances in zip(self.obstacle_widgets, distances):
+            widget.update_data(sensor_distances)
 
-        base_dist = 2000 # 기준 높이 2m
-        sensor_gap = 500 # 두 센서 간 거리 50cm 가정
-        dist_diff = math.tan(math.radians(sim_angle)) * sensor_gap
-        s1_l_dist = int(base_dist - dist_diff / 2)
-        s1_r_dist = int(base_dist + dist_diff / 2)
-
-        self.tilt_indicator.setAngle(self._last_sim_angle)
-        self.s1_l_label.setText(f"S1-L: {s1_l_dist} mm")
-        self.s1_r_label.setText(f"S1-R: {s1_r_dist} mm")
-
-        # 2. 장애물 데이터 시뮬레이션 (점진적 변화)
-        all_distances = []
-        for i in range(5):
-            sensor_data = self._last_sim_distances[i]
-            for j in range(8):
-                # 이전 값에서 -50 ~ +50mm 사이로 변화
-                dist_change = (random.random() - 0.5) * 100
-                sensor_data[j] += dist_change
-                # 최소/최대 거리 제한
-                sensor_data[j] = max(50, min(4000, sensor_data[j]))
-
-            # 5% 확률로 갑작스러운 장애물 등장/사라짐
-            if random.random() < 0.02: # 확률을 조금 낮춤
-                pixel_idx = random.randint(0, 7)
-                # 현재 값이 멀면 가깝게, 가까우면 멀게 변경
-                if sensor_data[pixel_idx] > 1000:
-                    sensor_data[pixel_idx] = random.randint(50, 299)
-                else:
-                    sensor_data[pixel_idx] = random.randint(1500, 4000)
-
-        # 10% 확률로 '사람' 장애물 시뮬레이션 실행
-        if random.random() < 0.1:
-            target_sensor = random.randint(0, 4) # 5개 센서 중 하나를 랜덤 선택
-            person_dist = random.randint(400, 1200) # 사람까지의 거리
-            shoulder_width = random.uniform(1.5, 2.5) # 사람 어깨 너비
-            self.simulate_person_obstacle(target_sensor, person_dist, shoulder_width)
-
-        for i in range(5):
-            self.obstacle_widgets[i].update_data(self._last_sim_distances[i])
-            all_distances.extend(self._last_sim_distances[i])
-
-        min_dist = min(all_distances)
+    @Slot(int, str)
+    def update_status(self, min_dist: int, status: str):
+        """최소 감지 거리와 전체 시스템 상태를 표시합니다."""
         self.min_dist_label.setText(f"최소 감지 거리: {min_dist} mm")
 
-        # 3. 전체 시스템 상태 업데이트
-        if min_dist < Constants.OBSTACLE_DIST_CRITICAL:
-            self.status_label.setText("!!! OBSTACLE DETECTED !!!")
-            self.status_label.setStyleSheet(self.status_styles["OBSTACLE"])
-        elif abs(sim_angle) > Constants.TILT_ANGLE_WARNING:
-            self.status_label.setText("TILT WARNING")
-            self.status_label.setStyleSheet(self.status_styles["TILT"])
-        else:
-            self.status_label.setText("SYSTEM OK")
-            self.status_label.setStyleSheet(self.status_styles["OK"])
+        # 스타일시트 적용은 CSS 재해석과 위젯 재polish 를 일으키므로 상태가 바뀔 때만 수행
+        if status != self._current_status:
+            self.status_label.setText(self.status_messages[status])
+            self.status_label.setStyleSheet(self.status_styles[status])
+            self._current_status = status
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet(STYLESHEET)
+    QPixmapCache.setCacheLimit(Constants.PIXMAP_CACHE_LIMIT_KB)
 
     # CTRL+C (SIGINT) 를 받으면 Qt 앱을 안전하게 종료
     signal.signal(signal.SIGINT, lambda *_: app.quit())